@@ -10,12 +10,15 @@ It demonstrates the convolution operation step-by-step, showing:
 """
 
 import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
 
+from signallab.signals import (
+    compute_convolution_axes,
+    compute_signal_axes,
+    parse_signal
+)
 from signallab.plotting import (
     plot_signal,
-    plot_signal_with_grid,
+    plot_signal_decomposition,
     plot_shifted_impulse_responses,
     plot_convolution_result
 )
@@ -41,16 +44,19 @@ YMAX = st.sidebar.number_input(
 col1, col2 = st.columns(2)
 
 # ============================================================================
-# LEFT COLUMN: Input Signal x(n)
+# INPUT: Signal x(n), used by both columns
 # ============================================================================
 with col1:
     st.subheader("Input Signal x(n)")
 
     # User input for signal x(n)
-    x = np.fromstring(
-        st.text_input("x(n) values (comma-separated, e.g., 1,2,1)", "1,2,1"),
-        sep=","
-    )
+    try:
+        x = parse_signal(
+            st.text_input("x(n) values (comma-separated, e.g., 1,2,1)", "1,2,1")
+        )
+    except ValueError:
+        st.error("x(n) must be a comma-separated list of numbers")
+        st.stop()
     start_x = int(st.number_input(
         label="Starting index for x(n)",
         value=0,
@@ -58,47 +64,59 @@ with col1:
         help="The time index where x(n) begins"
     ))
 
+
+# ============================================================================
+# LEFT COLUMN: Input Signal x(n)
+# ============================================================================
+def left_column(x, start_x, ymax):
+    """
+    Plot x(n) and its decomposition into scaled unit impulses.
+
+    Args:
+        x: Array of signal x(n) values
+        start_x: Starting index of signal x(n)
+        ymax: Maximum value for y-axis
+    """
     # Generate time indices for x(n)
-    n_x = np.arange(start_x, start_x + len(x))
+    axes_x = compute_signal_axes(len(x), start_x)
+    n_x, xlim_x = axes_x.n, axes_x.xlim
 
     # Plot the complete signal x(n)
-    xlim_x = (start_x - 2, start_x + len(x) + 2)
-    fig = plot_signal(n_x, x, "x(n)", xlim_x, YMAX, n_x, color='C0')
-    st.pyplot(fig)
+    svg = plot_signal(n_x, x, "x(n)", xlim_x, ymax, n_x, color='C0')
+    st.image(svg, width="stretch")
 
     # ========================================================================
     # Signal Decomposition: Show x(n) as sum of scaled unit impulses
     # ========================================================================
-    st.markdown("### Signal Decomposition")
-    st.markdown("Breaking down x(n) into scaled and shifted unit impulses:")
-
-    for i in n_x:
-        # Display mathematical notation for each impulse component
-        if (i >= 0):
-            st.latex(f"x({i})\\,\\delta(n - {i})")
-        else:
-            st.latex(f"x({i})\\,\\delta(n + {-1 * i})")
-
-        # Plot the individual impulse component
-        signal_value = x[i - start_x]  # Get the coefficient for this impulse
-        fig = plot_signal_with_grid(
-            [i], [signal_value],
-            xlim_x, YMAX, n_x,
-            color='C0'
-        )
-        st.pyplot(fig)
+    plot_signal_decomposition(n_x, x, xlim_x, ymax, n_x)
+
 
 # ============================================================================
 # RIGHT COLUMN: Impulse Response h(n) and Convolution Steps
 # ============================================================================
-with col2:
+@st.fragment
+def right_column(x, start_x, ymax):
+    """
+    Read h(n) and plot it with the convolution steps and result.
+
+    Editing h(n) only reruns this fragment, as the left column does not
+    depend on it.
+
+    Args:
+        x: Array of signal x(n) values
+        start_x: Starting index of signal x(n)
+        ymax: Maximum value for y-axis
+    """
     st.subheader("Impulse Response h(n)")
 
     # User input for signal h(n)
-    h = np.fromstring(
-        st.text_input("h(n) values (comma-separated, e.g., 1,2,1)", "1,2,1"),
-        sep=","
-    )
+    try:
+        h = parse_signal(
+            st.text_input("h(n) values (comma-separated, e.g., 1,2,1)", "1,2,1")
+        )
+    except ValueError:
+        st.error("h(n) must be a comma-separated list of numbers")
+        return
     start_h = int(st.number_input(
         label="Starting index for h(n)",
         value=0,
@@ -106,33 +124,30 @@ with col2:
         help="The time index where h(n) begins"
     ))
 
-    # Generate base time indices for h(n)
-    n_h0 = np.arange(start_h, start_h + len(h))
+    # Generate time indices and the global axis range for the convolution plots
+    axes_x = compute_signal_axes(len(x), start_x)
+    axes_h = compute_signal_axes(len(h), start_h)
+    axes_y = compute_convolution_axes(len(x), len(h), start_x, start_h)
+    n_x, n_h0, xlim_h = axes_x.n, axes_h.n, axes_h.xlim
+    global_ticks, global_xlim = axes_y.global_ticks, axes_y.global_xlim
 
     # Plot the impulse response h(n)
-    xlim_h = (start_h - 2, start_h + len(h) + 2)
-    fig = plot_signal(n_h0, h, "h(n)", xlim_h, YMAX, n_h0, color='C1')
-    st.pyplot(fig)
-
-    # ========================================================================
-    # Compute global axis range for convolution visualization
-    # ========================================================================
-    # The convolution y[n] will span from start_y to end_y
-    start_y = start_x + start_h
-    end_y = start_y + (len(x) + len(h) - 2)
-
-    # Determine global axis limits to show all signals
-    global_min = min(start_x, start_h, start_y)
-    global_max = max(start_x + len(x) - 1, start_h + len(h) - 1, end_y)
-    global_ticks = np.arange(global_min, global_max + 1)
-    global_xlim = (global_min - 2, global_max + 2)
+    svg = plot_signal(n_h0, h, "h(n)", xlim_h, ymax, n_h0, color='C1')
+    st.image(svg, width="stretch")
 
     # ========================================================================
     # Convolution Steps: Show individual responses x(i) * h(n - i)
     # ========================================================================
-    plot_shifted_impulse_responses(n_x, x, start_x, h, n_h0, global_xlim, YMAX, global_ticks)
+    plot_shifted_impulse_responses(n_x, x, start_x, h, n_h0, global_xlim, ymax, global_ticks)
 
     # ========================================================================
     # Final Result: Convolution y(n) = x(n) * h(n)
     # ========================================================================
-    plot_convolution_result(x, h, start_x, start_h, global_xlim, YMAX, global_ticks)
+    plot_convolution_result(x, h, start_x, start_h, global_xlim, ymax, global_ticks)
+
+
+with col1:
+    left_column(x, start_x, YMAX)
+
+with col2:
+    right_column(x, start_x, YMAX)
@@ -5,14 +5,80 @@ This module contains functions for visualizing discrete-time signals
 and the convolution process.
 """
 
+import io
+import threading
+
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+
+# Signal length product from which _convolve uses the FFT.
+_FFT_CONVOLVE_THRESHOLD = 4096
+
+# Plots are cached in two layers. Figures are built without a y-axis
+# limit and kept by st.cache_resource, keyed on signal content, so a new
+# y-axis maximum never rebuilds them. Their SVG renderings are kept by
+# st.cache_data, keyed on content plus y-axis maximum, so reruns that
+# leave a plot unchanged do not render it again. The cached figures are
+# shared by all sessions: set_ylim + render must not interleave.
+_render_lock = threading.Lock()
+
+
+def _new_figure():
+    """
+    Create a figure with a single axes, outside of pyplot.
+
+    Figures created through pyplot stay in its global registry until
+    closed; these are freed as soon as nothing references them.
+
+    Returns:
+        Tuple of (Matplotlib figure, Matplotlib axes)
+    """
+    fig = Figure()
+    return fig, fig.subplots()
+
+
+def _render_svg(fig):
+    """
+    Render a figure to an SVG document.
+
+    Args:
+        fig: Matplotlib figure to render
+
+    Returns:
+        SVG XML string
+    """
+    buf = io.StringIO()
+    fig.savefig(buf, format="svg", bbox_inches="tight")
+    return buf.getvalue()
+
+
+@st.cache_resource(max_entries=128)
+def _cached_signal_fig(n_tuple, values_tuple, title, xlim, xticks_tuple, color):
+    """Build the plot_signal figure, without its y-axis limit."""
+    fig, ax = _new_figure()
+    _draw_stems(ax, n_tuple, values_tuple, color)
+    ax.set_xlim(xlim)
+    ax.set_xticks(xticks_tuple)
+    ax.set_xlabel("n")
+    ax.set_title(title)
+    return fig
+
+
+@st.cache_data(max_entries=64)
+def _render_signal(n_tuple, values_tuple, title, xlim, xticks_tuple, color, ymax):
+    """Render the plot_signal figure to SVG for a y-axis maximum."""
+    fig = _cached_signal_fig(n_tuple, values_tuple, title, xlim, xticks_tuple, color)
+    return _render_with_ymax([(fig, fig.axes[0])], ymax)[0]
 
 
 def plot_signal(n_values, signal_values, title, xlim, ylim, xticks, color='C0'):
     """
     Plot a discrete-time signal using stem plot.
+
+    The figure is cached on its content and rendered once per y-axis
+    maximum.
     
     Args:
         n_values: Array of time indices
@@ -24,44 +90,268 @@ def plot_signal(n_values, signal_values, title, xlim, ylim, xticks, color='C0'):
         color: Color specification for the plot (default: 'C0')
     
     Returns:
-        Matplotlib figure object
+        SVG XML string, to be shown with st.image
     """
-    fig, ax = plt.subplots()
-    linefmt = f"{color}-" if color != 'C0' else 'C0-'
-    markerfmt = f"{color}o" if color != 'C0' else 'C0o'
-    ax.stem(n_values, signal_values, basefmt=" ", linefmt=linefmt, markerfmt=markerfmt)
-    ax.set_xlim(xlim)
-    ax.set_ylim(ymax=ylim)
-    ax.set_xticks(xticks)
-    ax.set_xlabel("n")
-    ax.set_title(title)
-    return fig
+    return _render_signal(
+        tuple(n_values), tuple(signal_values), title,
+        tuple(xlim), tuple(xticks), color, ylim
+    )
 
 
-def plot_signal_with_grid(n_values, signal_values, xlim, ylim, xticks, color='C0'):
+def _stem_segments(n_values, signal_values):
     """
-    Plot a discrete-time signal with grid enabled.
-    
+    Build the vertical stem segments from (n, 0) to (n, value).
+
     Args:
+        n_values: Array of time indices
+        signal_values: Array of signal values, same shape as n_values
+
+    Returns:
+        Array of shape n_values.shape + (2, 2) with the segment end points
+    """
+    base = np.stack([n_values, np.zeros_like(signal_values)], axis=-1)
+    tip = np.stack([n_values, signal_values], axis=-1)
+    return np.stack([base, tip], axis=-2)
+
+
+def _draw_stems(ax, n_values, signal_values, color, segments=None):
+    """
+    Draw a stem plot as one LineCollection plus one scatter of marker heads.
+
+    Cheaper than ax.stem, which creates separate stem, marker and
+    baseline artists.
+
+    Args:
+        ax: Matplotlib axes to draw on
+        n_values: Array of time indices
+        signal_values: Array of signal values
+        color: Color specification for the plot
+        segments: Precomputed stem segments, as returned by _stem_segments
+            (default: computed from n_values and signal_values)
+    """
+    if segments is None:
+        segments = _stem_segments(
+            np.asarray(n_values, dtype=float),
+            np.asarray(signal_values, dtype=float)
+        )
+    ax.add_collection(LineCollection(segments, colors=color))
+    ax.scatter(n_values, signal_values, color=color, zorder=3)
+
+
+def _draw_signal_with_grid(ax, n_values, signal_values, xlim, xticks, color, segments=None):
+    """
+    Draw a discrete-time stem plot with grid on existing axes.
+
+    The y-axis limit is left to the caller, so cached axes can be reused
+    for any y-axis maximum.
+
+    Args:
+        ax: Matplotlib axes to draw on
         n_values: Array of time indices
         signal_values: Array of signal values
         xlim: Tuple of (xmin, xmax) for x-axis limits
-        ylim: Tuple of (ymin, ymax) for y-axis limits
         xticks: Array of x-axis tick positions
-        color: Color specification for the plot (default: 'C0')
-    
-    Returns:
-        Matplotlib figure object
+        color: Color specification for the plot
+        segments: Precomputed stem segments (default: None)
     """
-    fig, ax = plt.subplots()
-    linefmt = f"{color}-" if color != 'C0' else 'C0-'
-    markerfmt = f"{color}o" if color != 'C0' else 'C0o'
-    ax.stem(n_values, signal_values, basefmt=" ", linefmt=linefmt, markerfmt=markerfmt)
+    _draw_stems(ax, n_values, signal_values, color, segments)
     ax.set_xlim(xlim)
-    ax.set_ylim(ymax=ylim)
     ax.grid(True)
     ax.set_xticks(xticks)
-    return fig
+
+
+def _shift_label(i, term):
+    """
+    Format the term x(i) term(n - i) as a Matplotlib mathtext title.
+
+    Args:
+        i: Time index of the x(n) sample
+        term: LaTeX for the shifted signal (e.g. "\\delta" or "h")
+
+    Returns:
+        Mathtext string, e.g. "$x(-1)\\,h(n + 1)$"
+    """
+    if (i >= 0):
+        return f"$x({i})\\,{term}(n - {i})$"
+    return f"$x({i})\\,{term}(n + {-1 * i})$"
+
+
+def _build_grid_figs(n_table, value_table, titles, xlim, xticks, color):
+    """
+    Build one stem plot figure with grid per row of a table of signals.
+
+    The stem segments of the whole table are built with one broadcast and
+    each figure draws its row slice.
+
+    Args:
+        n_table: 2-D array of time indices, one signal per row
+        value_table: 2-D array of signal values, same shape as n_table
+        titles: Iterable of plot titles, one per row
+        xlim: Tuple of (xmin, xmax) for x-axis limits
+        xticks: Array of x-axis tick positions
+        color: Color specification for the plots
+
+    Returns:
+        List of (fig, ax) pairs
+    """
+    n_table = np.asarray(n_table, dtype=float)
+    value_table = np.asarray(value_table, dtype=float)
+    segment_table = _stem_segments(n_table, value_table)
+
+    figs = []
+    rows = zip(n_table, value_table, segment_table, titles)
+    for n_values, signal_values, segments, title in rows:
+        fig, ax = _new_figure()
+        _draw_signal_with_grid(ax, n_values, signal_values, xlim, xticks, color, segments)
+        ax.set_title(title)
+        figs.append((fig, ax))
+    return figs
+
+
+@st.cache_resource(max_entries=32)
+def _build_decomposition_figs(n_x_tuple, x_tuple, xlim, xticks_tuple):
+    """Build the figures of the unit impulses x(i) delta(n - i) making up x(n)."""
+    # One single-sample row per impulse
+    n_table = np.asarray(n_x_tuple)[:, None]
+    value_table = np.asarray(x_tuple)[:, None]
+    labels = (_shift_label(i, "\\delta") for i in n_x_tuple)
+    return _build_grid_figs(n_table, value_table, labels, xlim, xticks_tuple, 'C0')
+
+
+@st.cache_resource(max_entries=32)
+def _build_shifted_response_figs(x_tuple, h_tuple, start_x, n_h0_tuple, xlim, xticks_tuple):
+    """Build the figures of the shifted impulse responses x(i) h(n - i)."""
+    n_shifted, scaled = _compute_shifted_responses(x_tuple, h_tuple, start_x, n_h0_tuple)
+    labels = (_shift_label(i, "h") for i in range(start_x, start_x + len(x_tuple)))
+    return _build_grid_figs(n_shifted, scaled, labels, xlim, xticks_tuple, 'C1')
+
+
+def _render_with_ymax(figs, ymax):
+    """
+    Render cached figures to SVG after applying the y-axis maximum.
+
+    Args:
+        figs: List of (fig, ax) pairs
+        ymax: Maximum value for y-axis
+
+    Returns:
+        List of SVG XML strings
+    """
+    svgs = []
+    with _render_lock:
+        for fig, ax in figs:
+            ax.set_ylim(ymax=ymax)
+            svgs.append(_render_svg(fig))
+    return svgs
+
+
+@st.cache_data(max_entries=64)
+def _render_decomposition(n_x_tuple, x_tuple, xlim, xticks_tuple, ymax):
+    """Render the signal decomposition figures to SVG for a y-axis maximum."""
+    figs = _build_decomposition_figs(n_x_tuple, x_tuple, xlim, xticks_tuple)
+    return _render_with_ymax(figs, ymax)
+
+
+@st.cache_data(max_entries=64)
+def _render_shifted_responses(x_tuple, h_tuple, start_x, n_h0_tuple, xlim, xticks_tuple, ymax):
+    """Render the shifted impulse response figures to SVG for a y-axis maximum."""
+    figs = _build_shifted_response_figs(
+        x_tuple, h_tuple, start_x, n_h0_tuple, xlim, xticks_tuple
+    )
+    return _render_with_ymax(figs, ymax)
+
+
+def plot_signal_decomposition(n_x, x, xlim, ymax, xticks):
+    """
+    Plot the decomposition of x(n) into scaled and shifted unit impulses.
+
+    Args:
+        n_x: Array of time indices for signal x(n)
+        x: Array of signal x(n) values
+        xlim: Tuple of (xmin, xmax) for x-axis limits
+        ymax: Maximum value for y-axis
+        xticks: Array of x-axis tick positions
+    """
+    st.markdown("### Signal Decomposition")
+    st.markdown("Breaking down x(n) into scaled and shifted unit impulses:")
+
+    svgs = _render_decomposition(tuple(n_x), tuple(x), tuple(xlim), tuple(xticks), ymax)
+
+    st.image(svgs, width="stretch")
+
+
+def _compute_shifted_responses(x_tuple, h_tuple, start_x, n_h0_tuple):
+    """
+    Compute the shifted and scaled impulse responses x(i) h(n - i).
+
+    Args:
+        x_tuple: Tuple of signal x(n) values
+        h_tuple: Tuple of impulse response h(n) values
+        start_x: Starting index of signal x(n)
+        n_h0_tuple: Tuple of base time indices for h(n)
+
+    Returns:
+        Tuple of (n_shifted, scaled) 2-D arrays where row k holds the time
+        indices and values of x(i) h(n - i) for i = start_x + k
+    """
+    x = np.asarray(x_tuple, dtype=float)
+    h = np.asarray(h_tuple, dtype=float)
+    n_x = np.arange(start_x, start_x + len(x))
+
+    # h(n - i) means shift h by +i and scale it by x(i), for all i at once
+    n_shifted = np.add.outer(n_x, np.asarray(n_h0_tuple, dtype=int))
+    scaled = np.multiply.outer(x, h)
+    return n_shifted, scaled
+
+
+def _convolve(x, h):
+    """
+    Convolve two signals, switching to FFT convolution for long inputs.
+
+    Direct convolution costs len(x) * len(h) multiply-adds; once that
+    product reaches _FFT_CONVOLVE_THRESHOLD, the O(N log N) FFT product
+    is used instead.
+
+    Args:
+        x: Array of signal x(n) values
+        h: Array of impulse response h(n) values
+
+    Returns:
+        Array of convolution y(n) values
+    """
+    # np.convolve is already a compiled direct kernel: on the few-sample
+    # signals typed in the UI a call takes about a microsecond
+    if len(x) * len(h) < _FFT_CONVOLVE_THRESHOLD:
+        return np.convolve(x, h)
+
+    n = len(x) + len(h) - 1
+    nfft = 1 << (n - 1).bit_length()
+    return np.fft.irfft(np.fft.rfft(x, nfft) * np.fft.rfft(h, nfft), nfft)[:n]
+
+
+@st.cache_data
+def _compute_convolution(x_tuple, h_tuple, start_x, start_h):
+    """
+    Compute the convolution y(n) = x(n) * h(n) and its time indices.
+
+    Cached on signal content so reruns triggered by unrelated widgets
+    (e.g. the y-axis limit) skip the recomputation.
+
+    Args:
+        x_tuple: Tuple of signal x(n) values
+        h_tuple: Tuple of impulse response h(n) values
+        start_x: Starting index of signal x(n)
+        start_h: Starting index of signal h(n)
+
+    Returns:
+        Tuple of (n_y, y) arrays
+    """
+    y = _convolve(np.asarray(x_tuple, dtype=float), np.asarray(h_tuple, dtype=float))
+
+    # Determine time indices for convolution result
+    start_y = start_x + start_h
+    n_y = np.arange(start_y, start_y + len(y))
+    return n_y, y
 
 
 def plot_shifted_impulse_responses(n_x, x, start_x, h, n_h0, global_xlim, ymax, global_ticks):
@@ -84,26 +374,12 @@ def plot_shifted_impulse_responses(n_x, x, start_x, h, n_h0, global_xlim, ymax,
     st.markdown("### Convolution Steps")
     st.markdown("Each component of x(n) produces a shifted and scaled version of h(n):")
 
-    for i in n_x:
-        # Get the scaling coefficient from x(n)
-        coeff = x[i - start_x]
-
-        # Display mathematical notation for this shifted impulse response
-        if (i >= 0):
-            st.latex(f"x({i})\\,h(n - {i})")
-        else:
-            st.latex(f"x({i})\\,h(n + {-1 * i})")
+    svgs = _render_shifted_responses(
+        tuple(x), tuple(h), start_x, tuple(n_h0),
+        tuple(global_xlim), tuple(global_ticks), ymax
+    )
 
-        # Compute shifted indices: h(n - i) means shift h by +i
-        n_hi = n_h0 + i
-
-        # Plot the scaled and shifted impulse response
-        fig = plot_signal_with_grid(
-            n_hi, coeff * h,
-            global_xlim, ymax, global_ticks,
-            color='C1'
-        )
-        st.pyplot(fig)
+    st.image(svgs, width="stretch")
 
 
 def plot_convolution_result(x, h, start_x, start_h, global_xlim, ymax, global_ticks):
@@ -122,13 +398,8 @@ def plot_convolution_result(x, h, start_x, start_h, global_xlim, ymax, global_ti
     st.markdown("### Convolution Result")
     st.markdown("The output y(n) is the sum of all shifted impulse responses:")
 
-    # Compute convolution using NumPy
-    y = np.convolve(x, h)
-
-    # Determine time indices for convolution result
-    start_y = start_x + start_h
-    n_y = np.arange(start_y, start_y + len(y))
+    n_y, y = _compute_convolution(tuple(x), tuple(h), start_x, start_h)
 
     # Plot the final convolution result
-    fig = plot_signal(n_y, y, "y(n) = x(n) * h(n)", global_xlim, ymax, global_ticks, color='C3')
-    st.pyplot(fig)
+    svg = plot_signal(n_y, y, "y(n) = x(n) * h(n)", global_xlim, ymax, global_ticks, color='C3')
+    st.image(svg, width="stretch")
@@ -0,0 +1,106 @@
+"""
+Signal helpers for SignalLab.
+
+This module contains functions for turning user input into
+discrete-time signals.
+"""
+
+from dataclasses import dataclass
+
+import streamlit as st
+import numpy as np
+
+
+@dataclass(frozen=True)
+class SignalAxes:
+    """
+    Time indices and x-axis limits of a single signal.
+
+    Attributes:
+        n: Tuple of time indices
+        xlim: Tuple of (xmin, xmax) for x-axis limits
+    """
+    n: tuple
+    xlim: tuple
+
+
+@dataclass(frozen=True)
+class ConvolutionAxes:
+    """
+    Axis range shared by the convolution plots.
+
+    Attributes:
+        global_ticks: Tuple of x-axis tick positions
+        global_xlim: Tuple of (xmin, xmax) for x-axis limits
+    """
+    global_ticks: tuple
+    global_xlim: tuple
+
+
+@st.cache_data
+def parse_signal(text):
+    """
+    Parse a comma-separated list of values into a signal.
+
+    Cached on the raw text so reruns triggered by other widgets skip
+    the parsing.
+
+    Args:
+        text: Comma-separated signal values (e.g. "1,2,1")
+
+    Returns:
+        Array of signal values
+
+    Raises:
+        ValueError: If a value is not a valid number, or there are no values
+    """
+    values = [float(s) for s in text.split(",") if s.strip()]
+    if not values:
+        raise ValueError("signal has no values")
+    return np.array(values, dtype=np.float64)
+
+
+def compute_signal_axes(length, start):
+    """
+    Compute the time indices and x-axis limits of a single signal.
+
+    Args:
+        length: Number of samples of the signal
+        start: Starting index of the signal
+
+    Returns:
+        SignalAxes of the signal
+    """
+    return SignalAxes(
+        n=tuple(range(start, start + length)),
+        xlim=(start - 2, start + length + 2),
+    )
+
+
+def compute_convolution_axes(len_x, len_h, start_x, start_h):
+    """
+    Compute the axis range shared by the convolution plots.
+
+    It spans x(n), h(n) and the convolution y(n).
+
+    Args:
+        len_x: Number of samples of signal x(n)
+        len_h: Number of samples of impulse response h(n)
+        start_x: Starting index of signal x(n)
+        start_h: Starting index of signal h(n)
+
+    Returns:
+        ConvolutionAxes of the convolution plots
+    """
+    # The convolution y[n] will span from start_y to end_y
+    start_y = start_x + start_h
+    end_y = start_y + (len_x + len_h - 2)
+
+    # Determine global axis limits to show all signals
+    global_min = min(start_x, start_h, start_y)
+    global_max = max(start_x + len_x - 1, start_h + len_h - 1, end_y)
+
+    return ConvolutionAxes(
+        global_ticks=tuple(range(global_min, global_max + 1)),
+        global_xlim=(global_min - 2, global_max + 2),
+    )
@@ -0,0 +1,37 @@
+"""
+Tests for the convolution helper of SignalLab.
+
+Run with: python -m unittest discover tests
+"""
+
+import unittest
+
+import numpy as np
+
+from signallab.plotting import _FFT_CONVOLVE_THRESHOLD, _convolve
+
+
+class ConvolveTest(unittest.TestCase):
+    """Check _convolve against np.convolve on both sides of the FFT threshold."""
+
+    def assert_matches_np_convolve(self, len_x, len_h):
+        rng = np.random.default_rng(len_x * len_h)
+        x = rng.normal(size=len_x)
+        h = rng.normal(size=len_h)
+        np.testing.assert_allclose(_convolve(x, h), np.convolve(x, h), rtol=0, atol=1e-9)
+
+    def test_below_threshold(self):
+        self.assertLess(3 * 3, _FFT_CONVOLVE_THRESHOLD)
+        self.assert_matches_np_convolve(3, 3)
+
+    def test_at_threshold(self):
+        self.assertEqual(64 * 64, _FFT_CONVOLVE_THRESHOLD)
+        self.assert_matches_np_convolve(64, 64)
+
+    def test_above_threshold(self):
+        self.assert_matches_np_convolve(1000, 7)
+        self.assert_matches_np_convolve(513, 9)
+
+
+if __name__ == "__main__":
+    unittest.main()